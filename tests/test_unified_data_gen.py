@@ -218,6 +218,57 @@ def test_mixed_syntax():
     assert len(result['posts']) == 3
 
 
+#
+# TESTS - Seeded Generation
+#
+def test_seeded_single_table_reproducible():
+    """Test that equal seeds reproduce a single-table config."""
+    config = {
+        "tables": {
+            "users[4]": {
+                "user_id": "UNIQUE[int]",
+                "name": "NAME",
+                "email": "str",
+                "active": "bool"
+            }
+        }
+    }
+
+    first = dummy_data_generator.create_table(config, seed=42)
+    second = dummy_data_generator.create_table(config, seed=42)
+
+    assert first == second
+
+
+def test_seeded_multi_table_reproducible():
+    """Test that equal seeds reproduce a multi-table config."""
+    config = {
+        "config": {"NB_USERS": 3},
+        "shared": {
+            "user_id[[NB_USERS]]": "UNIQUE[int]"
+        },
+        "tables": {
+            "users[[NB_USERS]]": {
+                "user_id": "[[user_id]]",
+                "name": "NAME"
+            },
+            "posts[5]": {
+                "post_id": "UNIQUE[int]",
+                "user_id": "CHOOSE[[user_id]]",
+                "title": "POST_TITLE"
+            },
+            "jobs": {
+                "job": "JOB"
+            }
+        }
+    }
+
+    first = dummy_data_generator.create_table(config, seed=42)
+    second = dummy_data_generator.create_table(config, seed=42)
+
+    assert first == second
+
+
 #
 # TESTS - Response Generator Integration
 #
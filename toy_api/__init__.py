@@ -8,6 +8,13 @@ License: BSD 3-Clause
 
 """
 
-from .app import create_app
+__all__ = ["create_app"]
 
-__all__ = ["create_app"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Lazy re-export so importing toy_api (e.g. from the CLI) doesn't pull
+    # Flask until create_app is actually requested.
+    if name == "create_app":
+        from .app import create_app
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
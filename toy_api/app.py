@@ -11,14 +11,41 @@ License: BSD 3-Clause
 #
 # IMPORTS
 #
+import json
+import mmap
+import os
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
-from flask import Flask, jsonify
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+from flask import Flask, Response, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from toy_api.constants import DEFAULT_CONFIG_PATH
-from toy_api.response_generator import generate_response
+from toy_api.response_generator import resolve_response
+
+
+#
+# CONSTANTS
+#
+# Parsed-config cache keyed by (realpath, mtime, size) so repeat loads of
+# an unchanged file skip the YAML parse entirely. Size joins mtime in the
+# key to catch same-second rewrites on coarse-timestamp filesystems.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Translation table for deriving endpoint names from flask routes
+_ENDPOINT_TRANS = str.maketrans({'/': '_', '<': None, '>': None})
 
 
 #
@@ -33,9 +60,12 @@ def create_app(config_path: Optional[str] = None) -> Flask:
     Returns:
         Configured Flask application.
     """
-    print('CREATING APP', config_path)
     app = Flask(__name__)
 
+    # Use orjson for response serialization when available
+    if orjson is not None:
+        app.json = _OrjsonProvider(app)
+
     # Load configuration
     if config_path is None:
         config_path = DEFAULT_CONFIG_PATH
@@ -55,6 +85,27 @@ def create_app(config_path: Optional[str] = None) -> Flask:
 #
 # INTERNAL
 #
+class _OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson.
+
+    orjson serializes to bytes in C, so jsonify skips both the stdlib
+    encoder and the UTF-8 re-encode. Installed only when orjson is present.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json'
+        )
+
+
 def _load_config(config_path: str) -> Dict[str, Any]:
     """Load configuration from YAML file.
 
@@ -68,8 +119,23 @@ def _load_config(config_path: str) -> Dict[str, Any]:
         FileNotFoundError: If config file doesn't exist.
         yaml.YAMLError: If config file is invalid YAML.
     """
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file) or {}
+    stat = os.stat(config_path)
+    cache_key = (os.path.realpath(config_path), stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if stat.st_size == 0:
+        config = {}
+    else:
+        # Hand the loader a read-only mmap: libyaml decodes the raw bytes
+        # itself, skipping Python's text-mode decode and buffer copy.
+        with open(config_path, 'rb') as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                config = yaml.load(buffer, Loader=_YamlLoader) or {}
+
+    _CONFIG_CACHE[cache_key] = config
+    return config
 
 
 def _get_default_config() -> Dict[str, Any]:
@@ -92,33 +158,33 @@ def _get_default_config() -> Dict[str, Any]:
 
 
 def _register_routes(app: Flask, config: Dict[str, Any]) -> None:
-    print('_register_routes', app, config)
-
     """Register routes from configuration.
 
     Args:
         app: Flask application instance.
         config: Configuration dictionary.
     """
-    # Register API info endpoint
-    @app.route("/")
-    def api_info():
-        # Create metadata response excluding port and other sensitive info
-        metadata = {
-            "name": config.get("name", "Toy API"),
-            "description": config.get("description", "Configurable toy API server"),
-            "routes": []
-        }
-
-        # Add route information (routes and methods only, not implementation details)
-        for route_config in config.get("routes", []):
-            route_info = {
+    # Create metadata response excluding port and other sensitive info.
+    # The config is immutable after startup, so build and serialize the
+    # payload once instead of per request. Only routes and methods are
+    # exposed, not implementation details.
+    metadata = {
+        "name": config.get("name", "Toy API"),
+        "description": config.get("description", "Configurable toy API server"),
+        "routes": [
+            {
                 "route": route_config.get("route", "/"),
                 "methods": route_config.get("methods", ["GET"])
             }
-            metadata["routes"].append(route_info)
+            for route_config in config.get("routes", [])
+        ]
+    }
+    api_info_body = json.dumps(metadata)
 
-        return jsonify(metadata)
+    # Register API info endpoint
+    @app.route("/")
+    def api_info():
+        return Response(api_info_body, mimetype='application/json')
 
     # Register configured routes
     for route_config in config.get("routes", []):
@@ -133,7 +199,7 @@ def _register_routes(app: Flask, config: Dict[str, Any]) -> None:
         handler = _create_route_handler(response_type, route)
 
         # Register route with unique endpoint name
-        endpoint_name = f"route_{flask_route.replace('/', '_').replace('<', '').replace('>', '')}"
+        endpoint_name = f"route_{flask_route.translate(_ENDPOINT_TRANS)}"
         app.add_url_rule(flask_route, endpoint=endpoint_name, view_func=handler, methods=methods)
 
 
@@ -160,11 +226,22 @@ def _create_route_handler(response_type, path: str):
     Returns:
         Handler function that returns JSON response.
     """
-    print('_create_route_handler!!!!!!!!!!', response_type)
-    print('_create_route_handler!!!!!!!!!!', path)
+    # Resolve the concrete generator once so the per-request path is a
+    # single call instead of re-dispatching on the response type.
+    generate = resolve_response(response_type, path)
+
+    # Explicit responses on parameter-free routes are deterministic, so
+    # serialize once at registration and serve the cached body. Object-based
+    # responses stay dynamic (their dummy data is randomized per request).
+    if '{{' not in path and isinstance(response_type, (dict, list)):
+        cached_body = json.dumps(generate({}))
+
+        def handler(**kwargs):
+            return Response(cached_body, mimetype='application/json')
+
+        return handler
+
     def handler(**kwargs):
-        print('HANDLER!!!!!!!!!!', kwargs)
-        response_data = generate_response(response_type, kwargs, path)
-        return jsonify(response_data)
+        return jsonify(generate(kwargs))
 
     return handler
\ No newline at end of file
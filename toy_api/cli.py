@@ -11,13 +11,15 @@ License: BSD 3-Clause
 #
 # IMPORTS
 #
+import os
+import re
 import sys
+from functools import cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 
-from toy_api.app import _load_config, create_app
 from toy_api.config_discovery import find_config_path, get_available_configs, init_config_with_example
 from toy_api.constants import DEFAULT_HOST
 from toy_api.port_utils import get_port_from_config_or_auto
@@ -35,7 +37,9 @@ def cli(ctx: click.Context) -> None:
     Run without a command to list available configurations.
     """
     if ctx.invoked_subcommand is None:
-        _list_api_configs()
+        # Names alone answer "what's available" without reading any YAML;
+        # `toy_api list --details` gives the full per-config view.
+        _list_api_configs(details=False)
         _list_database_configs()
 
 
@@ -46,6 +50,8 @@ def cli(ctx: click.Context) -> None:
 def init() -> None:
     """Initialize toy_api_config directory with example configuration."""
     if init_config_with_example():
+        # The newly-copied example must show up in later listings
+        _render_api_configs.cache_clear()
         click.echo("✓ Created toy_api_config/ directory")
         click.echo("✓ Created toy_api_config/databases/ subdirectory")
         click.echo("✓ Created toy_api_config/apis/ subdirectory")
@@ -79,6 +85,9 @@ def start(config: str, host: str, port: Optional[int], debug: bool, start_all: b
       toy_api start --all versioned_remote
       toy_api start --all versioned_remote --out versioned_remote/0.1
     """
+    # Imported here so list/init/ps invocations never pay the Flask import
+    from toy_api.app import _load_config, create_app
+
     if start_all:
         _start_all_servers(config if config != "v1" else None, host, out)
         return
@@ -90,12 +99,9 @@ def start(config: str, host: str, port: Optional[int], debug: bool, start_all: b
         if not config_path:
             click.echo(f"Error: {config_message}", err=True)
             click.echo("\nAvailable configs:")
-            list_configs(apis=True, tables=False)
+            _list_api_configs(details=False)
             sys.exit(1)
 
-        # Create Flask app from discovered config
-        app = create_app(config_path)
-
         # Load config for port determination
         app_config = {}
         try:
@@ -103,13 +109,17 @@ def start(config: str, host: str, port: Optional[int], debug: bool, start_all: b
         except Exception as e:
             click.echo(f"Warning: Could not load config file: {e}")
 
-        # Determine port using smart port logic
+        # Determine port using smart port logic - bail on port conflicts
+        # before paying for route registration
         final_port, port_message = get_port_from_config_or_auto(app_config, port, host)
 
         if final_port == 0:
             click.echo(f"Error: {port_message}", err=True)
             sys.exit(1)
 
+        # Create Flask app from discovered config (reuses the cached parse)
+        app = create_app(config_path)
+
         click.echo("Starting toy API...")
         click.echo(f"Config: {config_message}")
         if port_message:
@@ -117,8 +127,8 @@ def start(config: str, host: str, port: Optional[int], debug: bool, start_all: b
         click.echo(f"Server: http://{host}:{final_port}")
         click.echo("Press Ctrl+C to stop")
 
-        # Start the server
-        app.run(host=host, port=final_port, debug=debug)
+        # Start the server (threaded so concurrent requests don't serialize)
+        app.run(host=host, port=final_port, debug=debug, threaded=True)
 
     except FileNotFoundError as e:
         click.echo(f"Error: Configuration file not found: {e}", err=True)
@@ -131,7 +141,8 @@ def start(config: str, host: str, port: Optional[int], debug: bool, start_all: b
 @cli.command(name="list")
 @click.option("--apis", is_flag=True, help="List only API configurations")
 @click.option("--tables", is_flag=True, help="List only table configurations")
-def list_configs(apis: bool, tables: bool) -> None:
+@click.option("--details/--no-details", default=False, help="Show name/description/port/routes per config")
+def list_configs(apis: bool, tables: bool, details: bool) -> None:
     """List available API and table configurations."""
     # If neither flag specified, show both
     if not apis and not tables:
@@ -139,7 +150,7 @@ def list_configs(apis: bool, tables: bool) -> None:
         tables = True
 
     if apis:
-        _list_api_configs()
+        _list_api_configs(details=details)
 
     if tables:
         _list_database_configs()
@@ -317,6 +328,8 @@ def _start_all_servers(directory: Optional[str], host: str, out_config: Optional
         host: Host to bind to.
         out_config: Config to print output for (None = last server).
     """
+    from toy_api.app import _load_config
+
     # Determine search directory
     if directory:
         # Check if it's a subdirectory (e.g., "versioned_remote")
@@ -406,69 +419,181 @@ def _stop_servers_by_prefix(prefix: str) -> None:
             click.echo(f"✗ {message}", err=True)
 
 
-def _list_api_configs() -> None:
-    """List available API configuration files."""
-    click.echo("API Configurations:")
-    click.echo()
+# Listing only prints a handful of top-level scalars, so it scans them
+# with regexes instead of paying for a full YAML parse per config.
+_SUMMARY_SCALAR_RE = re.compile(r'^(name|description|port):[ \t]*(.+?)[ \t]*$', re.M)
+_ROUTE_ENTRY_RE = re.compile(r'^[ \t]*-[ \t]+route:', re.M)
+# Block-scalar header (| or > plus optional chomping/indent modifiers):
+# the value lives on the following lines, beyond the scanner's reach
+_BLOCK_SCALAR_RE = re.compile(r'^[|>](?:[0-9][+-]?|[+-][0-9]?)?$')
+_INLINE_COMMENT_RE = re.compile(r'[ \t]+#.*$')
+
+
+def _load_config_summary(config_path: str) -> Dict[str, Any]:
+    """Read just the fields the listing prints, without a full YAML parse.
+
+    Falls back to a full _load_config parse when the file doesn't match
+    the expected flat layout (e.g. quoted keys, flow style or block
+    scalars).
+
+    Args:
+        config_path: Path to YAML configuration file.
+
+    Returns:
+        Dictionary with name, description, port and route_count keys.
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    scalars = dict(_SUMMARY_SCALAR_RE.findall(text))
+    if not scalars:
+        return _parsed_config_summary(config_path)
+
+    for key, value in scalars.items():
+        if _BLOCK_SCALAR_RE.match(value):
+            return _parsed_config_summary(config_path)
+        quote = value[0] if value[0] in "'\"" else ''
+        if not quote or value[-1] != quote:
+            value = _INLINE_COMMENT_RE.sub('', value)
+        if quote and len(value) >= 2 and value[-1] == quote:
+            value = value[1:-1]
+        scalars[key] = value
+
+    route_count = len(_ROUTE_ENTRY_RE.findall(text))
+    if route_count == 0 and 'routes:' in text:
+        # Routes exist but not as block-sequence entries (e.g. flow
+        # style); only a real parse can count them
+        from toy_api.app import _load_config
+        route_count = len(_load_config(config_path).get("routes", []))
+
+    return {
+        "name": scalars.get("name", "Unknown"),
+        "description": scalars.get("description", "No description"),
+        "port": scalars.get("port", "Auto"),
+        "route_count": route_count,
+    }
+
+
+def _parsed_config_summary(config_path: str) -> Dict[str, Any]:
+    """Build the listing summary from a full config parse.
+
+    Args:
+        config_path: Path to YAML configuration file.
+
+    Returns:
+        Dictionary with name, description, port and route_count keys.
+    """
+    from toy_api.app import _load_config
+    config = _load_config(config_path)
+    return {
+        "name": config.get("name", "Unknown"),
+        "description": config.get("description", "No description"),
+        "port": config.get("port", "Auto"),
+        "route_count": len(config.get("routes", [])),
+    }
+
+
+def _render_config_section(configs: List[Tuple[str, str]], details: bool) -> str:
+    """Render one listing section, as names only or full detail blocks.
+
+    Args:
+        configs: List of (config_name, config_path) tuples.
+        details: If True, render the full per-config detail block.
+
+    Returns:
+        The section text.
+    """
+    if details:
+        return _render_config_details(configs)
+    names = "\n".join(f"  {config_name}" for config_name, _ in configs)
+    return f"{names}\n"
+
+
+def _render_config_details(configs: List[Tuple[str, str]]) -> str:
+    """Render the detail block for each config.
+
+    Args:
+        configs: List of (config_name, config_path) tuples.
+
+    Returns:
+        The joined detail blocks.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def load_one(config_path: str) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+        try:
+            return _load_config_summary(config_path), None
+        except Exception as e:
+            return None, e
+
+    # Scan in parallel, then join sequentially to keep output ordered.
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(configs)))) as ex:
+        parsed = list(ex.map(lambda pair: load_one(pair[1]), configs))
+
+    blocks = []
+    for (config_name, config_path), (summary, error) in zip(configs, parsed):
+        if error is None:
+            blocks.append(
+                f"  {config_name}\n"
+                f"    Name: {summary['name']}\n"
+                f"    Description: {summary['description']}\n"
+                f"    Port: {summary['port']}\n"
+                f"    Routes: {summary['route_count']}\n"
+            )
+        else:
+            blocks.append(f"  {config_name} (Error loading: {error})\n")
+    return "\n".join(blocks)
+
+
+def _list_api_configs(details: bool = True) -> None:
+    """List available API configuration files.
+
+    Args:
+        details: If True, print name/description/port/routes per config;
+                 if False, print names only (no YAML reads).
+    """
+    click.echo(_render_api_configs(details))
+
+
+@cache
+def _render_api_configs(details: bool = True) -> str:
+    """Render the API config listing once per process.
+
+    The no-subcommand path, the list command and the start error path
+    all show this text, so it's cached for the process lifetime.
+
+    Args:
+        details: If True, include name/description/port/routes per config.
+
+    Returns:
+        The full listing text.
+    """
+    parts: List[str] = ["API Configurations:", ""]
 
     configs = get_available_configs()
 
     # Show local configs first
     if configs["local"]:
-        click.echo("📁 Local configs (toy_api_config/apis/):")
-        for config_name in sorted(configs["local"]):
-            try:
-                config_path, _ = find_config_path(config_name)
-                if config_path:
-                    config = _load_config(config_path)
-                    name = config.get("name", "Unknown")
-                    description = config.get("description", "No description")
-                    config_port = config.get("port", "Auto")
-                    route_count = len(config.get("routes", []))
-
-                    click.echo(f"  {config_name}")
-                    click.echo(f"    Name: {name}")
-                    click.echo(f"    Description: {description}")
-                    click.echo(f"    Port: {config_port}")
-                    click.echo(f"    Routes: {route_count}")
-                    click.echo()
-            except Exception as e:
-                click.echo(f"  {config_name} (Error loading: {e})")
-                click.echo()
+        parts.append("📁 Local configs (toy_api_config/apis/):")
+        parts.append(_render_config_section(sorted(configs["local"]), details))
     else:
-        click.echo("📁 Local configs (toy_api_config/apis/): None")
-        click.echo()
+        parts.append("📁 Local configs (toy_api_config/apis/): None")
+        parts.append("")
 
     # Show package configs
     if configs["package"]:
-        click.echo("📦 Package configs:")
-        for config_name in sorted(configs["package"]):
-            try:
-                config_path, _ = find_config_path(config_name)
-                if config_path:
-                    config = _load_config(config_path)
-                    name = config.get("name", "Unknown")
-                    description = config.get("description", "No description")
-                    config_port = config.get("port", "Auto")
-                    route_count = len(config.get("routes", []))
-
-                    click.echo(f"  {config_name}")
-                    click.echo(f"    Name: {name}")
-                    click.echo(f"    Description: {description}")
-                    click.echo(f"    Port: {config_port}")
-                    click.echo(f"    Routes: {route_count}")
-                    click.echo()
-            except Exception as e:
-                click.echo(f"  {config_name} (Error loading: {e})")
-                click.echo()
+        parts.append("📦 Package configs:")
+        parts.append(_render_config_section(sorted(configs["package"]), details))
     else:
-        click.echo("📦 Package configs: None found")
-        click.echo()
+        parts.append("📦 Package configs: None found")
+        parts.append("")
 
-    click.echo("Usage:")
-    click.echo("  toy_api start              # Use default (v1)")
-    click.echo("  toy_api start <config>     # Use specific config")
-    click.echo("  toy_api init               # Create toy_api_config/")
+    parts.append("Usage:")
+    parts.append("  toy_api start              # Use default (v1)")
+    parts.append("  toy_api start <config>     # Use specific config")
+    parts.append("  toy_api init               # Create toy_api_config/")
+
+    return "\n".join(parts)
 
 
 def _list_database_configs() -> None:
@@ -477,79 +602,96 @@ def _list_database_configs() -> None:
     click.echo()
 
     # Check local configs
-    local_dir = Path("toy_api_config/databases")
-    local_configs = []
-    if local_dir.exists():
-        local_configs = list(local_dir.glob("*.yaml"))
+    local_configs = _scan_yaml_stems("toy_api_config/databases")
 
     # Check package configs
-    try:
-        import importlib.resources as pkg_resources
-        package_dir = Path(pkg_resources.files("toy_api") / "config" / "databases")
-        package_configs = list(package_dir.glob("*.yaml")) if package_dir.exists() else []
-    except Exception:
-        package_configs = []
+    package_dir = _package_database_dir()
+    package_configs = _scan_yaml_stems(str(package_dir)) if package_dir else []
 
+    # One echo per section rather than one per config name.
     if local_configs:
-        click.echo("📁 Local configs (toy_api_config/databases/):")
-        for config_file in sorted(local_configs):
-            click.echo(f"  {config_file.stem}")
-        click.echo()
+        names = "\n".join(f"  {config_name}" for config_name in local_configs)
+        click.echo(f"📁 Local configs (toy_api_config/databases/):\n{names}\n")
     else:
-        click.echo("📁 Local configs (toy_api_config/databases/): None")
-        click.echo()
+        click.echo("📁 Local configs (toy_api_config/databases/): None\n")
 
     if package_configs:
-        click.echo("📦 Package configs:")
-        for config_file in sorted(package_configs):
-            click.echo(f"  {config_file.stem}")
-        click.echo()
+        names = "\n".join(f"  {config_name}" for config_name in package_configs)
+        click.echo(f"📦 Package configs:\n{names}\n")
     else:
-        click.echo("📦 Package configs: None found")
-        click.echo()
+        click.echo("📦 Package configs: None found\n")
 
     click.echo("Usage:")
     click.echo("  toy_api database <config>              # Generate all tables")
     click.echo("  toy_api database <config> --tables <t> # Generate specific tables")
 
 
+def _scan_yaml_stems(directory: str) -> List[str]:
+    """List .yaml config stems in a directory via one scandir pass.
+
+    scandir reuses the stat info from the directory read, unlike glob
+    which re-stats every entry.
+
+    Args:
+        directory: Directory to scan.
+
+    Returns:
+        Sorted list of file stems (empty if directory doesn't exist).
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".yaml") and entry.is_file(follow_symlinks=False)
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+@cache
+def _package_database_dir() -> Optional[Path]:
+    """Resolve the package database config directory once per process.
+
+    Returns:
+        Path to the package databases directory, or None if unresolvable.
+    """
+    try:
+        import importlib.resources as pkg_resources
+        return Path(pkg_resources.files("toy_api") / "config" / "databases")
+    except Exception:
+        return None
+
+
 def _find_database_config(config_name: str) -> Optional[str]:
     """Find database configuration file by name.
 
+    Checks, in order: the name as a direct path, the name with .yaml
+    appended, the local config directory, then the package config
+    directory.
+
     Args:
         config_name: Config name or path.
 
     Returns:
         Path to config file or None if not found.
     """
-    # Remove .yaml extension if provided
-    if config_name.endswith('.yaml'):
-        config_name = config_name[:-5]
-
-    # Check if it's a direct path
-    config_path = Path(config_name)
-    if config_path.exists():
-        return str(config_path)
-
-    # Add .yaml if needed
-    if not str(config_path).endswith('.yaml'):
-        config_path = Path(f"{config_name}.yaml")
-        if config_path.exists():
-            return str(config_path)
-
-    # Check local config directory
-    local_config = Path(f"toy_api_config/databases/{config_name}.yaml")
-    if local_config.exists():
-        return str(local_config)
-
-    # Check package config directory
-    try:
-        import importlib.resources as pkg_resources
-        package_config = Path(pkg_resources.files("toy_api") / "config" / "databases" / f"{config_name}.yaml")
-        if package_config.exists():
-            return str(package_config)
-    except Exception:
-        pass
+    # Normalize once: base name without extension, yaml name with it
+    base = config_name[:-5] if config_name.endswith('.yaml') else config_name
+    yaml_name = f"{base}.yaml"
+
+    candidates = [
+        base,
+        yaml_name,
+        f"toy_api_config/databases/{yaml_name}",
+    ]
+    package_dir = _package_database_dir()
+    if package_dir is not None:
+        candidates.append(os.path.join(str(package_dir), yaml_name))
+
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
 
     return None
 
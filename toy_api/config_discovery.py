@@ -13,6 +13,7 @@ License: BSD 3-Clause
 #
 import os
 import shutil
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
@@ -28,6 +29,7 @@ DEFAULT_CONFIG_NAME: str = "v1"
 #
 # PUBLIC
 #
+@cache
 def find_config_path(config_name: Optional[str] = None) -> tuple[str, str]:
     """Find the full path to a configuration file.
 
@@ -76,14 +78,19 @@ def find_config_path(config_name: Optional[str] = None) -> tuple[str, str]:
 
     # Normalize config name (ensure .yaml extension)
     config_name = _normalize_config_name(config_name)
+    stem = config_name.rsplit('.', 1)[0]
+
+    # Single cached map lookup covers both .yaml and .yml without
+    # per-extension stat probes
+    maps = _config_path_maps()
 
     # Priority 1: Check local project directory
-    local_path = _check_local_config(config_name)
+    local_path = maps["local"].get(stem)
     if local_path:
         return local_path, f"Using local config: {local_path}"
 
     # Priority 2: Check package configs directory
-    package_path = _check_package_config(config_name)
+    package_path = maps["package"].get(stem)
     if package_path:
         return package_path, f"Using package config: {config_name}"
 
@@ -91,52 +98,24 @@ def find_config_path(config_name: Optional[str] = None) -> tuple[str, str]:
     return "", f"Config '{config_name}' not found in {LOCAL_CONFIG_DIR}/apis/ or package configs/apis/"
 
 
-def get_available_configs() -> dict[str, list[str]]:
+@cache
+def get_available_configs() -> dict[str, list[tuple[str, str]]]:
     """Get lists of available configuration files.
 
     Includes both single-file configs and versioned configs (directories).
+    Paths are returned alongside names so callers (e.g. the CLI listing)
+    don't need a second find_config_path walk per config.
 
     Returns:
-        Dictionary with 'local' and 'package' keys containing lists of config names.
-        Versioned configs are listed as "name/version".
+        Dictionary with 'local' and 'package' keys containing lists of
+        (config_name, config_path) tuples. Versioned configs are listed
+        as "name/version".
     """
-    configs = {"local": [], "package": []}
-
-    # Check local configs
-    local_dir = Path(LOCAL_CONFIG_DIR) / "apis"
-    if local_dir.exists() and local_dir.is_dir():
-        # Single-file configs
-        for config_file in local_dir.glob("*.yaml"):
-            configs["local"].append(config_file.stem)
-        for config_file in local_dir.glob("*.yml"):
-            configs["local"].append(config_file.stem)
-
-        # Versioned configs (subdirectories)
-        for subdir in local_dir.iterdir():
-            if subdir.is_dir():
-                for version_file in subdir.glob("*.yaml"):
-                    configs["local"].append(f"{subdir.name}/{version_file.stem}")
-                for version_file in subdir.glob("*.yml"):
-                    configs["local"].append(f"{subdir.name}/{version_file.stem}")
-
-    # Check package configs
+    configs = {"local": _collect_configs(os.path.join(LOCAL_CONFIG_DIR, "apis")), "package": []}
+
     package_dir = _get_package_config_dir()
-    if package_dir and package_dir.exists():
-        apis_dir = package_dir / "apis"
-        if apis_dir.exists() and apis_dir.is_dir():
-            # Single-file configs
-            for config_file in apis_dir.glob("*.yaml"):
-                configs["package"].append(config_file.stem)
-            for config_file in apis_dir.glob("*.yml"):
-                configs["package"].append(config_file.stem)
-
-            # Versioned configs (subdirectories)
-            for subdir in apis_dir.iterdir():
-                if subdir.is_dir():
-                    for version_file in subdir.glob("*.yaml"):
-                        configs["package"].append(f"{subdir.name}/{version_file.stem}")
-                    for version_file in subdir.glob("*.yml"):
-                        configs["package"].append(f"{subdir.name}/{version_file.stem}")
+    if package_dir:
+        configs["package"] = _collect_configs(os.path.join(str(package_dir), "apis"))
 
     return configs
 
@@ -191,6 +170,11 @@ def init_config_with_example() -> bool:
             return False
 
         shutil.copy2(v1_source, example_target)
+
+        # Newly-copied files must be visible to subsequent discovery calls
+        find_config_path.cache_clear()
+        get_available_configs.cache_clear()
+        _config_path_maps.cache_clear()
         return True
 
     except Exception:
@@ -200,6 +184,46 @@ def init_config_with_example() -> bool:
 #
 # INTERNAL
 #
+def _collect_configs(apis_dir: str) -> list[tuple[str, str]]:
+    """Collect (name, path) pairs for configs in an apis directory.
+
+    One scandir pass per directory: DirEntry reuses the stat info from
+    the directory read, unlike glob which re-stats every entry.
+
+    Args:
+        apis_dir: Directory containing .yaml/.yml configs and versioned
+                  subdirectories.
+
+    Returns:
+        List of (config_name, config_path) tuples (empty if the
+        directory doesn't exist).
+    """
+    configs = []
+    subdirs = []
+
+    try:
+        with os.scandir(apis_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(('.yaml', '.yml')) and entry.is_file(follow_symlinks=False):
+                    configs.append((entry.name.rsplit('.', 1)[0], entry.path))
+                elif entry.is_dir():
+                    subdirs.append((entry.name, entry.path))
+    except (FileNotFoundError, NotADirectoryError):
+        return configs
+
+    # Versioned configs (subdirectories)
+    for subdir_name, subdir_path in subdirs:
+        try:
+            with os.scandir(subdir_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.yaml', '.yml')) and entry.is_file(follow_symlinks=False):
+                        configs.append((f"{subdir_name}/{entry.name.rsplit('.', 1)[0]}", entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+    return configs
+
+
 def _check_versioned_config(base_name: str, version: str, base_dir: str) -> Optional[str]:
     """Check if a versioned config exists.
 
@@ -216,16 +240,15 @@ def _check_versioned_config(base_name: str, version: str, base_dir: str) -> Opti
         version = f"{version}.yaml"
 
     # Check for versioned config: base_dir/apis/base_name/version.yaml
-    versioned_path = Path(base_dir) / "apis" / base_name / version
-    if versioned_path.exists() and versioned_path.is_file():
-        return str(versioned_path)
+    versioned_path = os.path.join(base_dir, "apis", base_name, version)
+    if os.path.isfile(versioned_path):
+        return versioned_path
 
     # Also try .yml extension if .yaml was requested
     if version.endswith('.yaml'):
-        yml_version = version.replace('.yaml', '.yml')
-        yml_path = Path(base_dir) / "apis" / base_name / yml_version
-        if yml_path.exists() and yml_path.is_file():
-            return str(yml_path)
+        yml_path = f"{versioned_path[:-5]}.yml"
+        if os.path.isfile(yml_path):
+            return yml_path
 
     return None
 
@@ -244,68 +267,51 @@ def _normalize_config_name(config_name: str) -> str:
     return config_name
 
 
-def _check_local_config(config_name: str) -> Optional[str]:
-    """Check if config exists in local project directory.
-
-    Args:
-        config_name: Config filename with extension.
-
-    Returns:
-        Full path if found, None otherwise.
-    """
-    local_path = Path(LOCAL_CONFIG_DIR) / "apis" / config_name
-    if local_path.exists() and local_path.is_file():
-        return str(local_path)
-
-    # Also try .yml extension if .yaml was requested
-    if config_name.endswith('.yaml'):
-        yml_path = Path(LOCAL_CONFIG_DIR) / "apis" / config_name.replace('.yaml', '.yml')
-        if yml_path.exists() and yml_path.is_file():
-            return str(yml_path)
-
-    return None
-
-
-def _check_package_config(config_name: str) -> Optional[str]:
-    """Check if config exists in package configs directory.
+@cache
+def _config_path_maps() -> dict[str, dict[str, str]]:
+    """Build stem -> path maps for local and package configs.
 
-    Args:
-        config_name: Config filename with extension.
+    Derived from the already-cached get_available_configs scan, so
+    lookups in find_config_path cost a dict.get instead of stat probes
+    per extension. When both .yaml and .yml exist for a stem, .yaml
+    wins (matching the old probe order).
 
     Returns:
-        Full path if found, None otherwise.
+        Dictionary with 'local' and 'package' keys mapping config stems
+        to full paths.
     """
-    package_dir = _get_package_config_dir()
-    if not package_dir:
-        return None
-
-    package_path = package_dir / "apis" / config_name
-    if package_path.exists() and package_path.is_file():
-        return str(package_path)
-
-    # Also try .yml extension if .yaml was requested
-    if config_name.endswith('.yaml'):
-        yml_path = package_dir / "apis" / config_name.replace('.yaml', '.yml')
-        if yml_path.exists() and yml_path.is_file():
-            return str(yml_path)
-
-    return None
+    maps = {}
+    for scope, entries in get_available_configs().items():
+        scope_map: dict[str, str] = {}
+        for name, path in entries:
+            if name not in scope_map or path.endswith('.yaml'):
+                scope_map[name] = path
+        maps[scope] = scope_map
+    return maps
 
 
+@cache
 def _get_package_config_dir() -> Optional[Path]:
     """Get path to package configs directory.
 
+    Resolved once per process: first via importlib.resources (correct
+    for installed packages), then by filesystem layout relative to this
+    module (source checkouts).
+
     Returns:
         Path to package configs directory, or None if not found.
     """
     try:
-        # Get the directory where this module is located
-        current_dir = Path(__file__).parent
-        # Go up one level to the toy_api package root, then to configs
-        package_root = current_dir.parent
-        config_dir = package_root / PACKAGE_CONFIG_DIR
+        from importlib.resources import files
+        config_dir = Path(str(files("toy_api"))).parent / PACKAGE_CONFIG_DIR
+        if config_dir.is_dir():
+            return config_dir
+    except Exception:
+        pass
 
-        if config_dir.exists() and config_dir.is_dir():
+    try:
+        config_dir = Path(__file__).parent.parent / PACKAGE_CONFIG_DIR
+        if config_dir.is_dir():
             return config_dir
     except Exception:
         pass
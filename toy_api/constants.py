@@ -12,7 +12,7 @@ License: BSD 3-Clause
 #
 # IMPORTS
 #
-from typing import Any, Dict, List
+from typing import Tuple
 
 
 #
@@ -23,7 +23,7 @@ DEFAULT_HOST: str = "127.0.0.1"
 DEFAULT_PORT: int = 8000
 
 # Dummy data for user generation
-FIRST_NAMES: List[str] = [
+FIRST_NAMES: Tuple[str, ...] = (
     # English/Western names
     "Alice", "Charlie", "Diana", "Edward", "George", "Helen", "Luna", "Oscar",
     # Arabic/Middle Eastern names
@@ -44,9 +44,9 @@ FIRST_NAMES: List[str] = [
     "Dimitri", "Katya", "Pavel", "Anya", "Sergei", "Natasha", "Viktor", "Olga",
     # Silly names
     "Zigzag", "Sparkle", "Moonbeam", "Pickle", "Bubblegum", "Stardust", "Rainbow", "Fizzbuzz"
-]
+)
 
-LAST_NAMES: List[str] = [
+LAST_NAMES: Tuple[str, ...] = (
     # English/Western surnames
     "Anderson", "Brown", "Davis", "Evans", "Foster", "Harris", "Miller", "Parker",
     # Arabic/Middle Eastern surnames
@@ -67,46 +67,46 @@ LAST_NAMES: List[str] = [
     "Petrov", "Volkov", "Smirnov", "Ivanov", "Kozlov", "Sokolov", "Popov", "Lebedev",
     # Silly surnames
     "Gigglebottom", "Snugglepuff", "Wibblewobble", "Twinkletoes", "Bumblebee", "Sparklehorn", "Jellybeans", "Moonwalker"
-]
+)
 
 # Dummy data for post generation
-POST_TITLES: List[str] = [
+POST_TITLES: Tuple[str, ...] = (
     "Introduction to APIs", "Building Scalable Systems", "Database Design Patterns",
     "Security Best Practices", "Testing Strategies", "DevOps Fundamentals",
     "Code Review Guidelines", "Performance Optimization", "Documentation Standards"
-]
+)
 
 # Locations for user profiles
-LOCATIONS: List[str] = [
+LOCATIONS: Tuple[str, ...] = (
     "San Francisco", "New York", "London", "Tokyo", "Berlin", "Toronto", "Sydney",
     "Amsterdam", "Barcelona", "Singapore", "Austin", "Seattle", "Portland"
-]
+)
 
 # Permissions for user access control
-PERMISSIONS: List[str] = [
+PERMISSIONS: Tuple[str, ...] = (
     "read", "write", "delete", "admin", "create", "update", "execute", "manage"
-]
+)
 
 # Themes for user settings
-THEMES: List[str] = ["light", "dark", "auto"]
+THEMES: Tuple[str, ...] = ("light", "dark", "auto")
 
 # Languages for user settings
-LANGUAGES: List[str] = ["en", "es", "fr", "de", "it", "pt", "ja", "ko", "zh"]
+LANGUAGES: Tuple[str, ...] = ("en", "es", "fr", "de", "it", "pt", "ja", "ko", "zh")
 
 # Tags for posts
-POST_TAGS: List[str] = [
+POST_TAGS: Tuple[str, ...] = (
     "tech", "api", "tutorial", "guide", "tips", "best-practices", "development",
     "programming", "web", "mobile", "database", "security", "performance"
-]
+)
 
 # Recent activities for admin dashboard
-ADMIN_ACTIVITIES: List[str] = [
+ADMIN_ACTIVITIES: Tuple[str, ...] = (
     "User login", "Data backup", "System update", "Security scan",
     "Cache refresh", "Database maintenance", "Log rotation", "Config update"
-]
+)
 
 # Job titles for user bios
-JOBS: List[str] = [
+JOBS: Tuple[str, ...] = (
     "Rainbow Chaser", "Professional Cloud Watcher", "Unicorn Trainer", "Dragon Whisperer",
     "Bubble Wrap Popper", "Professional Daydreamer", "Sock Puppet Engineer", "Chief Giggle Officer",
     "Ninja Cat Herder", "Professional Nap Taker", "Jelly Bean Sommelier", "Moonbeam Collector",
@@ -118,4 +118,4 @@ JOBS: List[str] = [
     "Professional Thumb Wrestler", "Shooting Star Catcher", "Chief Silliness Officer",
     "Professional Belly Laugh Technician", "Magic Carpet Test Pilot", "Chief Giggling Scientist",
     "Professional Marshmallow Architect", "Rainbow Painting Specialist", "Chief Wonder Officer"
-]
\ No newline at end of file
+)
\ No newline at end of file
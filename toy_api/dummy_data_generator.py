@@ -15,13 +15,26 @@ License: BSD 3-Clause
 #
 import csv
 import json
+import os
 import random
 import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from toy_api.constants import (
     ADMIN_ACTIVITIES,
     FIRST_NAMES,
@@ -42,7 +55,38 @@ from toy_api.constants import (
 # Object cache for loaded object definitions
 _OBJECTS_CACHE: Dict[str, Dict[str, Any]] = {}
 
-CONSTANT_MAP: Dict[str, List[str]] = {
+# Parsed-config cache keyed by (realpath, mtime, size), mirroring the app
+# loader: repeat create_table calls on an unchanged file skip the YAML
+# parse. Size joins mtime to catch same-second rewrites.
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Pandas module memoized by _get_pandas: None until first use, False once
+# an import attempt has failed
+_PANDAS: Any = None
+
+# Dedicated generator: keeps dummy data independent of other users of the
+# global random state and gives callers a single place to seed for
+# reproducible output.
+_RNG = random.Random()
+
+# Spec patterns compiled once - these run per cell on the generation hot
+# loop, so skip re's per-call cache lookup.
+_BRACKET_COUNT_RE = re.compile(r'\[\[([^\]]+)\]\]\[([^\]]+)\]')
+_UNIQUE_RE = re.compile(r'UNIQUE\[([^\]]+)\]')
+_CHOOSE_RE = re.compile(r'CHOOSE\[\[([^\]]+)\]\](?:\[([^\]]+)\])?')
+_CONST_SEL_RE = re.compile(r'([A-Z_]+)\[([n0-9]+)\]')
+_DATE_RE = re.compile(r'DATE\[([^\]]+)\]')
+_RANGE_RE = re.compile(r'^\s*(\d+)\s*-\s*(\d+)\s*$')
+_COL_CFGVAR_RE = re.compile(r'([^\[]+)\[\[([^\]]+)\]\]')
+_COL_INT_RE = re.compile(r'([^\[]+)\[(\d+)\]')
+
+# Value pool for bulk "int" columns (same distribution as randint(0, 1000))
+_INT_POOL = range(0, 1001)
+
+# Alphabet for random strings, built once instead of per call
+_RAND_ALPHABET = string.ascii_letters + string.digits
+
+CONSTANT_MAP: Dict[str, Tuple[str, ...]] = {
     "FIRST_NAMES": FIRST_NAMES,
     "LAST_NAMES": LAST_NAMES,
     "POST_TITLES": POST_TITLES,
@@ -66,10 +110,26 @@ CONSTANT_MAP: Dict[str, List[str]] = {
     "JOB": JOBS,
 }
 
+# Derived once from CONSTANT_MAP: (values, is_plural, length) per name, so
+# the per-cell constant branch is one dict hit and a tuple unpack.
+_CONST_INFO: Dict[str, Tuple[Tuple[str, ...], bool, int]] = {
+    name: (values, name.endswith("S"), len(values))
+    for name, values in CONSTANT_MAP.items()
+}
+
 
 #
 # PUBLIC
 #
+def seed(value: Optional[int] = None) -> None:
+    """Seed the module's random generator for reproducible data.
+
+    Args:
+        value: Seed value (None re-randomizes from system entropy).
+    """
+    _RNG.seed(value)
+
+
 def create_table(
         table_config: Union[str, Dict[str, Any]],
         dest: Optional[str] = None,
@@ -77,7 +137,8 @@ def create_table(
         partition_cols: Optional[List[str]] = None,
         to_dataframe: bool = False,
         tables_filter: Optional[List[str]] = None,
-        force: bool = False) -> Union[List[Dict[str, Any]], Any]:
+        force: bool = False,
+        seed: Optional[int] = None) -> Union[List[Dict[str, Any]], Any]:
     """Create table data from configuration.
 
     Args:
@@ -88,6 +149,8 @@ def create_table(
         to_dataframe: Return DataFrame instead of list of dicts (if pandas available).
         tables_filter: Optional list of table names to generate (default: all).
         force: Overwrite existing files (default: False).
+        seed: Optional seed for reproducible data (seeded runs generate
+              tables serially).
 
     Returns:
         List of dictionaries (one per row) or DataFrame if to_dataframe=True.
@@ -96,6 +159,10 @@ def create_table(
         FileNotFoundError: If config file doesn't exist.
         ValueError: If config format is invalid.
     """
+    # Seed the module generator for reproducible output
+    if seed is not None:
+        _RNG.seed(seed)
+
     # Load configuration
     if isinstance(table_config, str):
         config = _load_config(table_config)
@@ -120,13 +187,35 @@ def create_table(
     # Generate shared data
     shared_data = _generate_shared(shared_def, config_values)
 
-    # Generate all tables
-    all_tables = {}
+    # Resolve names, columns and row counts in one up-front pass: the
+    # random row-count fallback then draws in the main thread, which
+    # keeps it deterministic for seeded runs even when tables generate
+    # concurrently below.
+    jobs = []
     for table_spec, columns in tables_def.items():
         # Parse table name to remove [[config]] syntax
-        table_name, _ = _parse_column_spec(table_spec, config_values)
-        table_data = _generate_table(table_spec, columns, shared_data, config_values)
-        all_tables[table_name] = table_data
+        table_name, row_count = _parse_column_spec(table_spec, config_values)
+        columns = _resolve_object(columns)
+        jobs.append((table_name, columns, _resolve_row_count(columns, row_count, shared_data)))
+
+    # Generate all tables. They are independent once shared_data exists,
+    # and much of the per-cell work (choices/sample/compiled regex
+    # matches) runs in C, so multi-table configs generate concurrently.
+    # Seeded runs stay serial: parallel draws interleave with thread
+    # timing, which would break reproducibility.
+    if len(jobs) > 1 and seed is None:
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            futures = {
+                table_name: executor.submit(
+                    _generate_table, columns, row_count, shared_data, config_values)
+                for table_name, columns, row_count in jobs
+            }
+            all_tables = {name: future.result() for name, future in futures.items()}
+    else:
+        all_tables = {
+            table_name: _generate_table(columns, row_count, shared_data, config_values)
+            for table_name, columns, row_count in jobs
+        }
 
     # Write to file if dest provided
     if dest:
@@ -135,22 +224,20 @@ def create_table(
     # Return results
     if len(all_tables) == 1:
         # Single table - return just the table data
-        result = list(all_tables.values())[0]
+        result = next(iter(all_tables.values()))
     else:
         # Multiple tables - return dict of table_name -> data
         result = all_tables
 
-    # Convert to dataframe if requested
+    # Convert to dataframe if requested (pandas not available: return
+    # list of dicts)
     if to_dataframe:
-        try:
-            import pandas as pd
+        pd = _get_pandas()
+        if pd is not None:
             if isinstance(result, list):
                 return pd.DataFrame(result)
             else:
                 return {name: pd.DataFrame(data) for name, data in result.items()}
-        except ImportError:
-            # Pandas not available, return list of dicts
-            pass
 
     return result
 
@@ -226,8 +313,38 @@ def _load_config(config_path: str) -> Dict[str, Any]:
     Raises:
         FileNotFoundError: If config file doesn't exist.
     """
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file) or {}
+    stat = os.stat(config_path)
+    cache_key = (os.path.realpath(config_path), stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Binary mode: libyaml decodes UTF-8 itself, so text mode would decode twice
+    with open(config_path, 'rb') as file:
+        config = yaml.load(file, Loader=_YamlLoader) or {}
+
+    _CONFIG_CACHE[cache_key] = config
+    return config
+
+
+def _get_pandas() -> Optional[Any]:
+    """Resolve the pandas module lazily, importing it at most once.
+
+    Keeps pandas off the module import path (it's only needed for
+    to_dataframe=True) while sparing repeat callers the import-system
+    lookup the old inline import paid per call.
+
+    Returns:
+        The pandas module, or None if pandas isn't installed.
+    """
+    global _PANDAS
+    if _PANDAS is None:
+        try:
+            import pandas
+            _PANDAS = pandas
+        except ImportError:
+            _PANDAS = False
+    return _PANDAS or None
 
 
 def _generate_shared(shared_def: Dict[str, Any], config_values: Dict[str, Any]) -> Dict[str, List[Any]]:
@@ -254,52 +371,65 @@ def _generate_shared(shared_def: Dict[str, Any], config_values: Dict[str, Any])
     return shared_data
 
 
+def _resolve_row_count(
+        columns: Dict[str, Any],
+        row_count: Optional[int],
+        shared_data: Dict[str, List[Any]]) -> int:
+    """Resolve a table's row count.
+
+    Explicit counts win; otherwise the first [[shared_col]] reference
+    sets the count, and tables with neither draw a random one.
+
+    Args:
+        columns: Resolved column definitions.
+        row_count: Explicit row count from the table spec, if any.
+        shared_data: Shared data columns.
+
+    Returns:
+        Number of rows to generate.
+    """
+    if row_count is not None:
+        return row_count
+
+    for col_spec in columns.values():
+        if isinstance(col_spec, str) and col_spec.startswith("[[") and col_spec.endswith("]]"):
+            shared_col_name = col_spec[2:-2]
+            if shared_col_name in shared_data:
+                return len(shared_data[shared_col_name])
+
+    return _RNG.randint(10, 50)
+
+
 def _generate_table(
-        table_spec: str,
         columns: Dict[str, Any],
+        row_count: int,
         shared_data: Dict[str, List[Any]],
         config_values: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Generate a single table.
 
     Args:
-        table_spec: Table name with optional row count (e.g., "users[10]").
-        columns: Column definitions (may include 'object' reference).
+        columns: Resolved column definitions (object references expanded).
+        row_count: Number of rows to generate.
         shared_data: Shared data columns.
         config_values: Config values for substitution.
 
     Returns:
         List of row dictionaries.
     """
-    # Resolve object reference if present
-    columns = _resolve_object(columns)
-
-    # Parse table name and row count
-    table_name, row_count = _parse_column_spec(table_spec, config_values)
-
-    # Determine actual row count from columns or shared data
-    if row_count is None:
-        # Find row count from shared data references
-        for col_spec in columns.values():
-            if isinstance(col_spec, str) and col_spec.startswith("[[") and col_spec.endswith("]]"):
-                shared_col_name = col_spec[2:-2]
-                if shared_col_name in shared_data:
-                    row_count = len(shared_data[shared_col_name])
-                    break
-
-        # If still no row count, use random
-        if row_count is None:
-            row_count = random.randint(10, 50)
-
-    # Generate table data
-    table_data = []
-    for row_idx in range(row_count):
-        row = {}
-        for col_name, value_spec in columns.items():
-            value = _generate_cell_value(value_spec, row_idx, config_values, shared_data)
-            row[col_name] = value
-        table_data.append(row)
-
-    return table_data
+    # Compile each column's spec once; the row loop then only runs the
+    # per-row handlers instead of re-parsing specs per cell.
+    col_names = list(columns)
+    handlers = [
+        _compile_spec(value_spec, config_values, shared_data)
+        for value_spec in columns.values()
+    ]
+
+    # dict(zip(...)) assembles each row through CPython's fast path
+    # instead of hashing every column name again per row[k] = v assignment
+    return [
+        dict(zip(col_names, [handler(row_idx) for handler in handlers]))
+        for row_idx in range(row_count)
+    ]
 
 
 def _generate_column(
@@ -319,14 +449,14 @@ def _generate_column(
         List of column values.
     """
     if row_count is None:
-        row_count = random.randint(10, 50)
+        row_count = _RNG.randint(10, 50)
 
-    column_values = []
-    for row_idx in range(row_count):
-        value = _generate_cell_value(value_spec, row_idx, config_values, shared_data)
-        column_values.append(value)
+    bulk = _compile_bulk_spec(value_spec)
+    if bulk is not None:
+        return bulk(row_count)
 
-    return column_values
+    handler = _compile_spec(value_spec, config_values, shared_data)
+    return [handler(row_idx) for row_idx in range(row_count)]
 
 
 def _generate_cell_value(
@@ -336,6 +466,10 @@ def _generate_cell_value(
         shared_data: Dict[str, List[Any]]) -> Any:
     """Generate a single cell value.
 
+    Thin wrapper over _compile_spec so the spec grammar has one
+    implementation; the compile cost is trivial next to the draws the
+    handler performs.
+
     Args:
         value_spec: Value specification (string, list, dict, or other type).
         row_idx: Row index for shared data lookup.
@@ -345,208 +479,285 @@ def _generate_cell_value(
     Returns:
         Generated value.
     """
-    # Handle YAML parsing of [[name]] as nested list
-    # YAML interprets [[name]] as a list containing a list with one element
+    return _compile_spec(value_spec, config_values, shared_data)(row_idx)
+
+
+def _compile_bulk_spec(value_spec: Any) -> Optional[Callable[[int], List[Any]]]:
+    """Return a whole-column generator for bulk-eligible specs.
+
+    Specs whose values are independent draws from a fixed pool can be
+    produced with one C-level choices() call per column instead of one
+    Python-level call per cell. Returns None when the spec needs the
+    per-row handler (position-dependent or nested specs).
+
+    Args:
+        value_spec: Value specification.
+
+    Returns:
+        Callable taking a row count and returning the full column, or
+        None if the spec isn't bulk-eligible.
+    """
+    if not isinstance(value_spec, str):
+        return None
+
+    if value_spec == "NAME":
+        def bulk(count: int) -> List[Any]:
+            firsts = _RNG.choices(FIRST_NAMES, k=count)
+            lasts = _RNG.choices(LAST_NAMES, k=count)
+            return [f"{first} {last}" for first, last in zip(firsts, lasts)]
+        return bulk
+
+    if value_spec in CONSTANT_MAP and not value_spec.endswith("S"):
+        const_list = CONSTANT_MAP[value_spec]
+        return lambda count: _RNG.choices(const_list, k=count)
+
+    if value_spec == "int":
+        return lambda count: _RNG.choices(_INT_POOL, k=count)
+
+    if value_spec == "bool":
+        return lambda count: _RNG.choices((True, False), k=count)
+
+    # UNIQUE[int] columns are a pure sequence - one range materialization,
+    # no RNG at all
+    if value_spec == "UNIQUE[int]":
+        return lambda count: list(range(1000, 1000 + count))
+
+    return None
+
+
+def _compile_spec(
+        value_spec: Any,
+        config_values: Dict[str, Any],
+        shared_data: Dict[str, List[Any]]) -> Callable[[int], Any]:
+    """Classify a value spec once and return a per-row handler.
+
+    This is the single implementation of the cell-spec grammar: column
+    generation compiles each spec once per column, and per-cell callers
+    go through the _generate_cell_value wrapper. The returned callable
+    does only the per-row work (random draws, shared lookups).
+
+    Args:
+        value_spec: Value specification (string, list, dict, or other type).
+        config_values: Config values for substitution.
+        shared_data: Shared data columns.
+
+    Returns:
+        Callable taking a row index and returning a cell value.
+    """
+    # YAML parses [[name]] as a nested list; unrecognized list shapes
+    # pass through as-is like any other non-string spec
     if isinstance(value_spec, list):
-        # Handle [[item]][[count]] syntax (e.g., [[object.core.user]][[n]])
-        if len(value_spec) == 2:
-            if isinstance(value_spec[0], list) and len(value_spec[0]) == 1:
-                if isinstance(value_spec[1], list) and len(value_spec[1]) == 1:
-                    item_spec = value_spec[0][0]
-                    count_spec = value_spec[1][0]
-
-                    # Handle [[object.NAMESPACE.NAME]][[count]]
-                    if isinstance(item_spec, str) and item_spec.startswith('object.'):
-                        object_name = item_spec[7:]  # Remove 'object.' prefix
-
-                        # Determine count
-                        if count_spec == 'n':
-                            count = random.randint(1, 5)
-                        else:
-                            count = int(count_spec)
-
-                        # Generate list of objects
-                        return [
-                            generate_object(object_name, row_idx=row_idx + i)
-                            for i in range(count)
-                        ]
-
-        # Handle single [[item]] syntax
-        if len(value_spec) == 1:
-            if isinstance(value_spec[0], list) and len(value_spec[0]) == 1:
-                item = value_spec[0][0]
-
-                # Handle [[object.NAMESPACE.NAME]] - single object instance
-                if isinstance(item, str) and item.startswith('object.'):
-                    object_name = item[7:]  # Remove 'object.' prefix
-                    return generate_object(object_name, row_idx=row_idx)
-
-                # Handle [[300-500]] - range syntax
-                if isinstance(item, str) and '-' in item and item.replace('-', '').isdigit():
-                    parts = item.split('-')
-                    start = int(parts[0])
-                    end = int(parts[1])
-                    return random.randint(start, end)
-
-                # Handle [[shared_col_name]] - shared column reference
-                shared_col_name = item
-                if shared_col_name in shared_data:
-                    shared_col = shared_data[shared_col_name]
-                    if row_idx < len(shared_col):
-                        return shared_col[row_idx]
-                    else:
-                        # Row index exceeds shared data length, choose random
-                        return random.choice(shared_col)
-                else:
-                    raise ValueError(f"Shared column '{shared_col_name}' not found in shared data")
-
-    # If value_spec is not a string, return it as-is
+        handler = _compile_list_spec(value_spec, shared_data)
+        if handler is not None:
+            return handler
+        return lambda row_idx: value_spec
+
+    # Non-string specs are constants
     if not isinstance(value_spec, str):
-        return value_spec
+        return lambda row_idx: value_spec
 
-    # Handle [[...]][count] string format (e.g., [[object.core.user]][5])
-    match = re.match(r'\[\[([^\]]+)\]\]\[([^\]]+)\]', value_spec)
+    # [[...]][count] string format (e.g., [[object.core.user]][5])
+    match = _BRACKET_COUNT_RE.match(value_spec)
     if match:
         item_spec = match.group(1)
         count_spec = match.group(2)
 
-        # Handle [[object.NAMESPACE.NAME]][count]
         if item_spec.startswith('object.'):
-            object_name = item_spec[7:]  # Remove 'object.' prefix
-
-            # Determine count
+            object_name = item_spec[7:]
             if count_spec == 'n':
-                count = random.randint(1, 5)
-            else:
-                count = int(count_spec)
-
-            # Generate list of objects
-            return [
+                return lambda row_idx: [
+                    generate_object(object_name, row_idx=row_idx + i)
+                    for i in range(_RNG.randint(1, 5))
+                ]
+            count = int(count_spec)
+            return lambda row_idx: [
                 generate_object(object_name, row_idx=row_idx + i)
                 for i in range(count)
             ]
 
-        # Handle [[start-end]][count] - list of random numbers from range
         if '-' in item_spec and item_spec.replace('-', '').isdigit():
             parts = item_spec.split('-')
             start = int(parts[0])
             end = int(parts[1])
-
             if count_spec == 'n':
-                count = random.randint(1, 5)
-            else:
-                count = int(count_spec)
+                return lambda row_idx: [
+                    _RNG.randint(start, end) for _ in range(_RNG.randint(1, 5))
+                ]
+            count = int(count_spec)
+            return lambda row_idx: [_RNG.randint(start, end) for _ in range(count)]
 
-            return [random.randint(start, end) for _ in range(count)]
-
-    # Handle [[...]] string format
+    # [[...]] string format
     if value_spec.startswith("[[") and value_spec.endswith("]]"):
         inner = value_spec[2:-2]
 
-        # Handle [[object.NAMESPACE.NAME]] - single object instance
         if inner.startswith('object.'):
-            object_name = inner[7:]  # Remove 'object.' prefix
-            return generate_object(object_name, row_idx=row_idx)
+            object_name = inner[7:]
+            return lambda row_idx: generate_object(object_name, row_idx=row_idx)
 
-        # Handle [[300-500]] - range syntax
         if '-' in inner and inner.replace('-', '').isdigit():
             parts = inner.split('-')
             start = int(parts[0])
             end = int(parts[1])
-            return random.randint(start, end)
+            return lambda row_idx: _RNG.randint(start, end)
 
-        # Handle [[shared_col_name]] - shared data reference
         if inner in shared_data:
             shared_col = shared_data[inner]
-            if row_idx < len(shared_col):
-                return shared_col[row_idx]
-            else:
-                # Row index exceeds shared data length, choose random
-                return random.choice(shared_col)
-        else:
-            raise ValueError(f"Shared column '{inner}' not found")
+            shared_len = len(shared_col)
+            return lambda row_idx: (
+                shared_col[row_idx] if row_idx < shared_len else _RNG.choice(shared_col)
+            )
+        raise ValueError(f"Shared column '{inner}' not found")
 
-    # Handle special NAME constant
+    # Special NAME constants
     if value_spec == "NAME":
-        return f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
+        return lambda row_idx: f"{_RNG.choice(FIRST_NAMES)} {_RNG.choice(LAST_NAMES)}"
 
     if value_spec == "NAMES":
-        count = random.randint(1, 5)
-        return [f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}" for _ in range(count)]
-
-    # Handle UNIQUE verb
+        def handler(row_idx: int) -> List[str]:
+            count = _RNG.randint(1, 5)
+            firsts = _RNG.choices(FIRST_NAMES, k=count)
+            lasts = _RNG.choices(LAST_NAMES, k=count)
+            return [f"{first} {last}" for first, last in zip(firsts, lasts)]
+        return handler
+
+    # UNIQUE verb
     if value_spec.startswith("UNIQUE["):
-        return _generate_unique_value(value_spec, row_idx)
-
-    # Handle CHOOSE verb
+        match = _UNIQUE_RE.match(value_spec)
+        if not match:
+            return lambda row_idx: row_idx
+        value_type = match.group(1)
+        if value_type == "int":
+            return lambda row_idx: row_idx + 1000
+        if value_type == "str":
+            return lambda row_idx: f"unique_{row_idx:04d}"
+        return lambda row_idx: f"{value_type}_{row_idx}"
+
+    # CHOOSE / DATE verbs (already cheap: one precompiled regex match)
     if value_spec.startswith("CHOOSE["):
-        return _generate_choose_value(value_spec, shared_data)
+        return lambda row_idx: _generate_choose_value(value_spec, shared_data)
 
-    # Handle DATE verb
     if value_spec.startswith("DATE"):
-        return _generate_date_value(value_spec)
-
-    # Handle constants
-    if value_spec in CONSTANT_MAP:
-        # Check if it's plural form (return list) or singular (return single)
-        if value_spec.endswith("S"):
-            count = random.randint(1, len(CONSTANT_MAP[value_spec]))
-            return random.sample(CONSTANT_MAP[value_spec], count)
-        else:
-            return random.choice(CONSTANT_MAP[value_spec])
-
-    # Handle constants with selection [n] or [int]
-    match = re.match(r'([A-Z_]+)\[([n0-9]+)\]', value_spec)
-    if match:
-        const_name = match.group(1)
+        return lambda row_idx: _generate_date_value(value_spec)
+
+    # Constants
+    info = _CONST_INFO.get(value_spec)
+    if info is not None:
+        const_list, is_plural, const_len = info
+        if is_plural:
+            return lambda row_idx: _sample(const_list, _RNG.randint(1, const_len))
+        return lambda row_idx: _RNG.choice(const_list)
+
+    # Constants with selection [n] or [int]
+    match = _CONST_SEL_RE.match(value_spec)
+    if match and match.group(1) in CONSTANT_MAP:
+        const_list = CONSTANT_MAP[match.group(1)]
+        const_len = len(const_list)
         count_spec = match.group(2)
+        if count_spec == 'n':
+            return lambda row_idx: _sample(const_list, _RNG.randint(1, const_len))
+        count = min(int(count_spec), const_len)
+        return lambda row_idx: _sample(const_list, count)
 
-        if const_name in CONSTANT_MAP:
-            const_list = CONSTANT_MAP[const_name]
-            if count_spec == 'n':
-                count = random.randint(1, len(const_list))
-            else:
-                count = int(count_spec)
-            count = min(count, len(const_list))
-            return random.sample(const_list, count)
-
-    # Handle basic types
+    # Basic types
     if value_spec == "str":
-        return _generate_random_string()
-    elif value_spec == "int":
-        return random.randint(0, 1000)
-    elif value_spec == "float":
-        return round(random.uniform(0, 1000), 2)
-    elif value_spec == "bool":
-        return random.choice([True, False])
+        return lambda row_idx: _generate_random_string()
+    if value_spec == "int":
+        return lambda row_idx: _RNG.randint(0, 1000)
+    if value_spec == "float":
+        return lambda row_idx: round(_RNG.uniform(0, 1000), 2)
+    if value_spec == "bool":
+        return lambda row_idx: _RNG.choice([True, False])
 
-    # Default: return as-is
-    return value_spec
+    # Default: constant passthrough
+    return lambda row_idx: value_spec
 
 
-def _generate_unique_value(value_spec: str, row_idx: int) -> Any:
-    """Generate unique value based on specification.
+def _compile_list_spec(
+        value_spec: list,
+        shared_data: Dict[str, List[Any]]) -> Optional[Callable[[int], Any]]:
+    """Compile the nested-list spec forms YAML produces for [[...]].
+
+    YAML interprets [[name]] as a list containing a single-element list,
+    and [[item]][[count]] as two of them.
 
     Args:
-        value_spec: UNIQUE specification (e.g., "UNIQUE[int]").
-        row_idx: Row index to use for unique value.
+        value_spec: List-typed value specification.
+        shared_data: Shared data columns.
 
     Returns:
-        Unique value.
+        Per-row handler, or None when the list doesn't match a known
+        spec shape.
+
+    Raises:
+        ValueError: If a shared column reference isn't in shared_data.
     """
-    # Extract type from UNIQUE[type]
-    match = re.match(r'UNIQUE\[([^\]]+)\]', value_spec)
-    if not match:
-        return row_idx
+    # [[object.NAMESPACE.NAME]][[count]] - list of object instances
+    if (len(value_spec) == 2
+            and isinstance(value_spec[0], list) and len(value_spec[0]) == 1
+            and isinstance(value_spec[1], list) and len(value_spec[1]) == 1):
+        item_spec = value_spec[0][0]
+        count_spec = value_spec[1][0]
+
+        if isinstance(item_spec, str) and item_spec.startswith('object.'):
+            object_name = item_spec[7:]  # Remove 'object.' prefix
+            if count_spec == 'n':
+                return lambda row_idx: [
+                    generate_object(object_name, row_idx=row_idx + i)
+                    for i in range(_RNG.randint(1, 5))
+                ]
+            count = int(count_spec)
+            return lambda row_idx: [
+                generate_object(object_name, row_idx=row_idx + i)
+                for i in range(count)
+            ]
 
-    value_type = match.group(1)
+    # Single [[item]] forms
+    if len(value_spec) == 1 and isinstance(value_spec[0], list) and len(value_spec[0]) == 1:
+        item = value_spec[0][0]
 
-    if value_type == "int":
-        return row_idx + 1000  # Offset to avoid small numbers
-    elif value_type == "str":
-        return f"unique_{row_idx:04d}"
-    else:
-        return f"{value_type}_{row_idx}"
+        # [[object.NAMESPACE.NAME]] - single object instance
+        if isinstance(item, str) and item.startswith('object.'):
+            object_name = item[7:]  # Remove 'object.' prefix
+            return lambda row_idx: generate_object(object_name, row_idx=row_idx)
+
+        # [[300-500]] - range syntax
+        if isinstance(item, str) and '-' in item and item.replace('-', '').isdigit():
+            parts = item.split('-')
+            start = int(parts[0])
+            end = int(parts[1])
+            return lambda row_idx: _RNG.randint(start, end)
+
+        # [[shared_col_name]] - shared column reference
+        if item in shared_data:
+            shared_col = shared_data[item]
+            shared_len = len(shared_col)
+            return lambda row_idx: (
+                shared_col[row_idx] if row_idx < shared_len else _RNG.choice(shared_col)
+            )
+        raise ValueError(f"Shared column '{item}' not found in shared data")
+
+    return None
+
+
+def _sample(items: Union[List[Any], Tuple[Any, ...]], count: int) -> List[Any]:
+    """Sample count items without replacement.
+
+    When count spans the whole pool, sample() still runs its selection
+    machinery item by item; a copy plus shuffle is cheaper and
+    equivalent for that case.
+
+    Args:
+        items: Pool to sample from.
+        count: Number of items to pick (must be <= len(items)).
+
+    Returns:
+        List of sampled items.
+    """
+    if count == len(items):
+        picked = list(items)
+        _RNG.shuffle(picked)
+        return picked
+    return _RNG.sample(items, count)
 
 
 def _generate_choose_value(value_spec: str, shared_data: Dict[str, List[Any]]) -> Any:
@@ -563,8 +774,7 @@ def _generate_choose_value(value_spec: str, shared_data: Dict[str, List[Any]]) -
     # Handle range syntax: CHOOSE[[21-89]]
     # Handle shared column reference: CHOOSE[[column_name]]
     # Single bracket for count parameter, double bracket for items
-    pattern = r'CHOOSE\[\[([^\]]+)\]\](?:\[([^\]]+)\])?'
-    match = re.match(pattern, value_spec)
+    match = _CHOOSE_RE.match(value_spec)
 
     if not match:
         return None
@@ -575,33 +785,35 @@ def _generate_choose_value(value_spec: str, shared_data: Dict[str, List[Any]]) -
     # Check if items_spec is a shared column reference
     if items_spec in shared_data:
         items = shared_data[items_spec]
-    # Parse items
-    elif '-' in items_spec and items_spec.replace('-', '').replace(' ', '').isdigit():
-        # Range syntax: 21-89
-        parts = items_spec.split('-')
-        start = int(parts[0].strip())
-        end = int(parts[1].strip())
-        items = list(range(start, end + 1))
     else:
-        # List syntax: a, b, c
-        items = [item.strip() for item in items_spec.split(',')]
+        # Range syntax (21-89): one precompiled match instead of the
+        # replace/replace/isdigit scans, which allocated two throwaway
+        # strings per evaluation
+        range_match = _RANGE_RE.match(items_spec)
+        if range_match:
+            start = int(range_match.group(1))
+            end = int(range_match.group(2))
+            items = list(range(start, end + 1))
+        else:
+            # List syntax: a, b, c
+            items = [item.strip() for item in items_spec.split(',')]
 
     # Determine count
     if count_spec is None:
         # No count specified - return single item
-        return random.choice(items)
+        return _RNG.choice(items)
     elif count_spec == 'n':
         # Random count
-        count = random.randint(1, len(items))
+        count = _RNG.randint(1, len(items))
     elif count_spec == '1':
         # Exactly 1
-        return random.choice(items)
+        return _RNG.choice(items)
     else:
         # Specific count
         count = int(count_spec)
 
     count = min(count, len(items))
-    return random.sample(items, count)
+    return _sample(items, count)
 
 
 def _generate_date_value(value_spec: str) -> str:
@@ -620,7 +832,7 @@ def _generate_date_value(value_spec: str) -> str:
     end_date = datetime(2024, 12, 31, 23, 59, 59)
     time_between = end_date - start_date
     seconds_between = int(time_between.total_seconds())
-    random_seconds = random.randint(0, seconds_between)
+    random_seconds = _RNG.randint(0, seconds_between)
     random_datetime = start_date + timedelta(seconds=random_seconds)
 
     # Extract format if provided
@@ -629,7 +841,7 @@ def _generate_date_value(value_spec: str) -> str:
         return random_datetime.strftime("%Y-%m-%d")
 
     # Parse DATE[format]
-    match = re.match(r'DATE\[([^\]]+)\]', value_spec)
+    match = _DATE_RE.match(value_spec)
     if match:
         format_spec = match.group(1)
         # Use format_spec directly as Python strftime format
@@ -650,7 +862,7 @@ def _parse_column_spec(col_spec: str, config_values: Dict[str, Any]) -> tuple:
         Tuple of (column_name, row_count or None).
     """
     # Handle [[CONFIG_VAR]] syntax
-    match = re.match(r'([^\[]+)\[\[([^\]]+)\]\]', col_spec)
+    match = _COL_CFGVAR_RE.match(col_spec)
     if match:
         col_name = match.group(1)
         config_var = match.group(2)
@@ -658,7 +870,7 @@ def _parse_column_spec(col_spec: str, config_values: Dict[str, Any]) -> tuple:
         return col_name, row_count
 
     # Handle [int] syntax
-    match = re.match(r'([^\[]+)\[(\d+)\]', col_spec)
+    match = _COL_INT_RE.match(col_spec)
     if match:
         col_name = match.group(1)
         row_count = int(match.group(2))
@@ -677,8 +889,7 @@ def _generate_random_string(length: int = 10) -> str:
     Returns:
         Random string.
     """
-    import string
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+    return ''.join(_RNG.choices(_RAND_ALPHABET, k=length))
 
 
 def _write_tables(
@@ -751,8 +962,12 @@ def _write_parquet(
         import pyarrow as pa
         import pyarrow.parquet as pq
 
-        # Convert to PyArrow table
-        table = pa.Table.from_pylist(data)
+        # Transpose to columns and hand Arrow a pydict: from_pylist walks
+        # rows with per-key .get() calls, while a direct listcomp per
+        # column hits the shared key objects and lets Arrow infer each
+        # column's type from a single homogeneous list.
+        col_dict = {col: [row[col] for row in data] for col in data[0]} if data else {}
+        table = pa.Table.from_pydict(col_dict)
 
         # Write with or without partitioning
         if partition_cols:
@@ -776,9 +991,11 @@ def _write_csv(data: List[Dict[str, Any]], file_path: Path) -> None:
 
     with open(file_path, 'w', newline='') as csvfile:
         fieldnames = list(data[0].keys())
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+        # Plain writer over pre-extracted value lists: DictWriter re-looks
+        # up every fieldname per row on top of the same extraction
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows([row[field] for field in fieldnames] for row in data)
 
 
 def _write_json(data: List[Dict[str, Any]], file_path: Path) -> None:
@@ -788,6 +1005,12 @@ def _write_json(data: List[Dict[str, Any]], file_path: Path) -> None:
         data: Table data.
         file_path: Output file path.
     """
+    # orjson serializes to bytes in C when available; stdlib json is the
+    # fallback (orjson indents with 2 spaces, matching indent=2)
+    if orjson is not None:
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
     with open(file_path, 'w') as jsonfile:
         json.dump(data, jsonfile, indent=2)
 
@@ -799,9 +1022,15 @@ def _write_ld_json(data: List[Dict[str, Any]], file_path: Path) -> None:
         data: Table data.
         file_path: Output file path.
     """
+    if orjson is not None:
+        with open(file_path, 'wb') as jsonfile:
+            jsonfile.writelines(orjson.dumps(row) + b'\n' for row in data)
+        return
+
     with open(file_path, 'w') as jsonfile:
-        for row in data:
-            jsonfile.write(json.dumps(row) + '\n')
+        # writelines consumes the generator lazily: one write dispatch per
+        # row without building the whole payload in memory
+        jsonfile.writelines(json.dumps(row) + '\n' for row in data)
 
 
 def _load_objects(search_paths: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
@@ -845,8 +1074,8 @@ def _load_objects(search_paths: Optional[List[str]] = None) -> Dict[str, Dict[st
             file_name = yaml_file.stem  # e.g., 'core' from 'core.yaml'
 
             try:
-                with open(yaml_file, 'r') as f:
-                    file_objects = yaml.safe_load(f) or {}
+                with open(yaml_file, 'rb') as f:
+                    file_objects = yaml.load(f, Loader=_YamlLoader) or {}
 
                 # Each top-level key in the file is an object definition
                 for obj_name, obj_def in file_objects.items():
@@ -22,7 +22,7 @@ DEFAULT_PORT_RANGE_START: int = 5000
 DEFAULT_PORT_RANGE_END: int = 6000
 FALLBACK_PORT_RANGE_START: int = 9000
 FALLBACK_PORT_RANGE_END: int = 10000
-RESERVED_PORTS: list[int] = [8000, 8001, 8002, 8003, 8004, 8005]  # Reserved for API Box
+RESERVED_PORTS: frozenset[int] = frozenset({8000, 8001, 8002, 8003, 8004, 8005})  # Reserved for API Box
 
 
 #
@@ -62,13 +62,24 @@ def find_available_port(start_port: int = DEFAULT_PORT_RANGE_START,
     Returns:
         Available port number, or None if no ports available in range.
     """
-    for port in range(start_port, end_port + 1):
-        # Skip reserved ports
-        if port in RESERVED_PORTS:
-            continue
-        if is_port_available(port, host):
-            return port
-    return None
+    # One socket for the whole scan: a failed bind leaves the socket
+    # unbound and reusable, so each probed port costs one syscall instead
+    # of the three (socket/setsockopt/bind) a fresh socket would need.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        for port in range(start_port, end_port + 1):
+            # Skip reserved ports
+            if port in RESERVED_PORTS:
+                continue
+            try:
+                sock.bind((host, port))
+                return port
+            except (OSError, socket.error):
+                continue
+        return None
+    finally:
+        sock.close()
 
 
 def get_port_from_config_or_auto(config: dict,
@@ -12,7 +12,7 @@ License: BSD 3-Clause
 #
 # IMPORTS
 #
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Union
 
 from toy_api import dummy_data_generator
 
@@ -20,8 +20,12 @@ from toy_api import dummy_data_generator
 #
 # PUBLIC
 #
-def generate_response(response_type: Union[str, Dict, list], params: Dict[str, str], path: str) -> Union[Dict[str, Any], list]:
-    """Generate dummy response data based on response type.
+def resolve_response(response_type: Union[str, Dict, list], path: str) -> Callable[[Dict[str, str]], Union[Dict[str, Any], list]]:
+    """Resolve a response spec to a generator callable.
+
+    Dispatching on the response type happens once here, so route handlers
+    can bind the returned callable at registration time instead of
+    re-classifying the spec on every request.
 
     Supports two types of responses:
     1. Object-based: String reference to object (e.g., 'core.user', 'test.test_user')
@@ -29,45 +33,89 @@ def generate_response(response_type: Union[str, Dict, list], params: Dict[str, s
 
     Args:
         response_type: Object reference string OR explicit dict/list response.
-        params: URL parameters extracted from the route.
         path: Route path for additional context.
 
     Returns:
-        Dictionary or list containing the response data.
+        Callable taking URL params and returning the response data.
     """
-    # Handle explicit response (dict or list) - return as-is with param substitution
+    # Explicit response (dict or list) - return as-is with param substitution
     if isinstance(response_type, (dict, list)):
-        return _substitute_params(response_type, params)
+        def generate(params: Dict[str, str]) -> Union[Dict[str, Any], list]:
+            return _substitute_params(response_type, params)
+        return generate
 
-    # Handle object-based response (string reference)
+    # Object-based response (string reference)
     if isinstance(response_type, str):
-        # Use hash of params for consistent generation
-        row_idx = hash(str(sorted(params.items()))) % 1000 if params else 0
-
-        # Generate response from object definition
-        print("HI!!!!!!!!!!!!!!!!!!", response_type)
-        try:
-            return dummy_data_generator.generate_object(
-                response_type,
-                params=params,
-                row_idx=row_idx
-            )
-        except ValueError as e:
-            # Object not found, return error response
-            return {
+        # Probe the object definitions once at registration. Unknown
+        # objects stay unknown for the process lifetime (the cache loads
+        # once), so their handlers clone a prebuilt error skeleton
+        # instead of raising and catching per request.
+        if response_type not in dummy_data_generator._load_objects():
+            template = {
                 "error": "Response type not found",
                 "response_type": response_type,
-                "message": str(e),
+                "message": f"Object '{response_type}' not found in object definitions",
                 "path": path,
-                "params": params
+                "params": {}
             }
 
+            def generate(params: Dict[str, str]) -> Union[Dict[str, Any], list]:
+                response = template.copy()
+                response["params"] = params
+                return response
+            return generate
+
+        def generate(params: Dict[str, str]) -> Union[Dict[str, Any], list]:
+            # Use hash of params for consistent generation. Tuples hash
+            # directly - no intermediate str() allocation - and the
+            # single-param case (the common one) skips the sort too.
+            if not params:
+                row_idx = 0
+            elif len(params) == 1:
+                row_idx = hash(next(iter(params.items()))) & 1023
+            else:
+                row_idx = hash(tuple(sorted(params.items()))) & 1023
+            try:
+                return dummy_data_generator.generate_object(
+                    response_type,
+                    params=params,
+                    row_idx=row_idx
+                )
+            except ValueError as e:
+                # Generation failed mid-object (e.g. a field spec
+                # referencing a shared column that doesn't exist here),
+                # return error response
+                return {
+                    "error": "Response type not found",
+                    "response_type": response_type,
+                    "message": str(e),
+                    "path": path,
+                    "params": params
+                }
+        return generate
+
     # Unexpected type
-    return {
-        "error": "Invalid response type",
-        "response_type": str(type(response_type)),
-        "path": path
-    }
+    def generate(params: Dict[str, str]) -> Union[Dict[str, Any], list]:
+        return {
+            "error": "Invalid response type",
+            "response_type": str(type(response_type)),
+            "path": path
+        }
+    return generate
+
+
+def generate_response(response_type: Union[str, Dict, list], params: Dict[str, str], path: str) -> Union[Dict[str, Any], list]:
+    """Generate dummy response data based on response type.
+
+    Args:
+        response_type: Object reference string OR explicit dict/list response.
+        params: URL parameters extracted from the route.
+        path: Route path for additional context.
+
+    Returns:
+        Dictionary or list containing the response data.
+    """
+    return resolve_response(response_type, path)(params)
 
 
 #